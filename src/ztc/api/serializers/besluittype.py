@@ -1,9 +1,10 @@
-from rest_framework_nested.relations import NestedHyperlinkedRelatedField
-from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
-
 from ...datamodel.models import BesluitType
+from ..utils.fields import JaNeeField
+from ..utils.relations import NestedHyperlinkedRelatedField
 from ..utils.rest_flex_fields import FlexFieldsSerializerMixin
-from ..utils.serializers import SourceMappingSerializerMixin
+from ..utils.serializers import (
+    NestedHyperlinkedModelSerializer, SourceMappingSerializerMixin
+)
 
 
 class BesluitTypeSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMixin, NestedHyperlinkedModelSerializer):
@@ -14,6 +15,8 @@ class BesluitTypeSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMi
         'catalogus_pk': 'maakt_deel_uit_van__pk'
     }
 
+    publicatieIndicatie = JaNeeField(source='publicatie_indicatie', read_only=True)
+
     wordtVastgelegdIn = NestedHyperlinkedRelatedField(
         many=True,
         read_only=True,
@@ -48,7 +51,6 @@ class BesluitTypeSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMi
             'omschrijving': 'besluittype_omschrijving',
             'omschrijvingGeneriek': 'besluittype_omschrijving_generiek',
             'categorie': 'besluitcategorie',
-            'publicatieIndicatie': 'publicatie_indicatie',
             'publicatieTekst': 'publicatietekst',
             'publicatieTermijn': 'publicatietermijn',
             'ingangsdatumObject': 'datum_begin_geldigheid',
@@ -24,11 +24,12 @@ class ClientAPITestMixin(object):
 
 class CatalogusAPITestMixin(object):
     API_VERSION = '1'
+    CATALOGUS_DOMEIN = 'ABCDE'
 
     def setUp(self):
         super().setUp()
 
-        self.catalogus = CatalogusFactory.create(domein='ABCDE', rsin='000000001')
+        self.catalogus = CatalogusFactory.create(domein=self.CATALOGUS_DOMEIN, rsin='000000001')
 
         self.catalogus_list_url = reverse('api:catalogus-list', kwargs={'version': self.API_VERSION})
         self.catalogus_detail_url = reverse('api:catalogus-detail', kwargs={
@@ -2,13 +2,17 @@ import json
 import os
 from datetime import timedelta
 from unittest import expectedFailure, skip, skipIf
+from urllib.parse import urlsplit
 
-from django.test import LiveServerTestCase, TransactionTestCase
+from django.test import TestCase, TransactionTestCase
 from django.urls import reverse
 from django.utils import timezone
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
+import requests
 from oauth2_provider.models import AccessToken, Application
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
 from rest_framework.settings import api_settings
 
 from ...datamodel.models import Catalogus
@@ -24,7 +28,7 @@ class RestfulPrinciplesAPITests(APITestCase):
         super().setUp()
 
         self.besluittype = BesluitTypeFactory.create(
-            maakt_deel_uit_van=self.catalogus, publicatie_indicatie='J')
+            maakt_deel_uit_van=self.catalogus, publicatie_indicatie=True)
         self.informatieobjecttype = InformatieObjectTypeFactory.create(
             maakt_deel_uit_van=self.catalogus)
 
@@ -173,8 +177,45 @@ class RestfulPrinciplesAPITests(APITestCase):
         self.assertEqual(response.status_code, 400)
 
 
-class SecurityAPITests(CatalogusAPITestMixin, LiveServerTestCase):
+class DjangoClientAdapter(BaseAdapter):
+    """
+    Transport adapter for `requests` that passes the requests to the Django test client, instead of sending them to a
+    live server.
+    """
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        path = '{}?{}'.format(url.path, url.query) if url.query else url.path
+
+        extra = {
+            'HTTP_{}'.format(name.upper().replace('-', '_')): value for name, value in request.headers.items()
+            if name.lower() not in ('content-type', 'content-length')
+        }
+        django_response = self.client.generic(
+            request.method, path, data=request.body or '',
+            content_type=request.headers.get('Content-Type', 'application/octet-stream'),
+            secure=url.scheme == 'https', **extra
+        )
+
+        response = requests.Response()
+        response.status_code = django_response.status_code
+        response.headers = CaseInsensitiveDict(django_response.items())
+        response._content = django_response.content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class SecurityAPITests(CatalogusAPITestMixin, TestCase):
     """Section 2.6.2 of the DSO: API strategy"""
+    server_url = 'http://testserver'
 
     def setUp(self):
         super().setUp()
@@ -212,7 +253,7 @@ class SecurityAPITests(CatalogusAPITestMixin, LiveServerTestCase):
         Test the entire backend application flow:
         https://requests-oauthlib.readthedocs.io/en/latest/oauth2_workflow.html#backend-application-flow
         """
-        # The `LiveServerTestCase` does not use HTTPS.
+        # The test server does not use HTTPS.
         os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
 
         # Create application in the ZTC
@@ -226,15 +267,16 @@ class SecurityAPITests(CatalogusAPITestMixin, LiveServerTestCase):
         from requests_oauthlib import OAuth2Session
         client = BackendApplicationClient(client_id=application.client_id)
         oauth = OAuth2Session(client=client)
+        oauth.mount(self.server_url, DjangoClientAdapter(self.client))
 
         token = oauth.fetch_token(
-            token_url='{}/oauth2/token/'.format(self.live_server_url),
+            token_url='{}/oauth2/token/'.format(self.server_url),
             client_id=application.client_id,
             client_secret=application.client_secret
         )
 
-        # We use the live test server rather than the shortcut client.
-        list_url = '{}{}'.format(self.live_server_url, self.catalogus_list_url)
+        # The requests are passed to the test client by the adapter that is mounted on the session.
+        list_url = '{}{}'.format(self.server_url, self.catalogus_list_url)
 
         # Make request using requests_oauthlib
         response = oauth.get(list_url)
@@ -389,11 +431,13 @@ class UseJSONTests(APITestCase):
 
 class FilterSortSearchTests(APITestCase):
     """Section 2.6.6 of the DSO: API strategy"""
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
 
-        self.other_catalogus = Catalogus.objects.create(
-            domein=self.catalogus.domein, rsin='999999999', contactpersoon_beheer_naam='John Doe')
+        # Uses the same domain as the catalog that is created in `setUp`.
+        cls.other_catalogus = Catalogus.objects.create(
+            domein=cls.CATALOGUS_DOMEIN, rsin='999999999', contactpersoon_beheer_naam='John Doe')
 
     def test_filter_on_single_field(self):
         """DSO: API-34 (filter on single field)"""
@@ -622,6 +666,37 @@ class PaginationTests(APITestCase):
             self.assertTrue(key in links)
             self.assertEqual(links[key]['href'], url, key)
 
+    def test_pagination_without_count(self):
+        """Passing `?zondertelling=1` leaves out the total number of results and pages."""
+        response = self.api_client.get('{}?pagina=2&zondertelling=1'.format(self.catalogus_list_url))
+        self.assertEqual(response.status_code, 200)
+
+        self.assertFalse('X-Total-Count' in response)
+        self.assertFalse('X-Pagination-Count' in response)
+        self.assertEqual(response['X-Pagination-Page'], '2')
+        self.assertEqual(response['X-Pagination-Limit'], '2')
+
+        data = response.json()
+
+        self.assertEqual(len(data['results']), 2)
+        self.assertEqual(data['_links'], {
+            'self': {'href': 'http://testserver/api/v1/catalogussen/?pagina=2&zondertelling=1'},
+            'first': {'href': 'http://testserver/api/v1/catalogussen/?zondertelling=1'},
+            'prev': {'href': 'http://testserver/api/v1/catalogussen/?zondertelling=1'},
+            'next': {'href': 'http://testserver/api/v1/catalogussen/?pagina=3&zondertelling=1'},
+        })
+
+        response = self.api_client.get('{}?pagina=3&zondertelling=1'.format(self.catalogus_list_url))
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(len(data['results']), 1)
+        self.assertFalse('next' in data['_links'])
+
+        response = self.api_client.get('{}?pagina=4&zondertelling=1'.format(self.catalogus_list_url))
+        self.assertEqual(response.status_code, 404)
+
 
 class CachingTests(APITestCase):
     """Section 2.6.9 of the DSO: API strategy"""
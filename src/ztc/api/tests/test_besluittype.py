@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ...datamodel.tests.factories import BesluitTypeFactory
@@ -12,7 +14,7 @@ class BesluitTypeAPITests(APITestCase):
 
         self.besluittype = BesluitTypeFactory.create(
             maakt_deel_uit_van=self.catalogus,
-            publicatie_indicatie='J'
+            publicatie_indicatie=True
         )
 
         self.is_relevant_voor = self.besluittype.zaaktypes.get()
@@ -39,6 +41,26 @@ class BesluitTypeAPITests(APITestCase):
         self.assertTrue('results' in data)
         self.assertEqual(len(data['results']), 1)
 
+    def test_get_list_does_not_query_per_object(self):
+        """Retrieving a list of `BesluitType` objects does not do a query per (related) object."""
+        with CaptureQueriesContext(connection) as single_object_queries:
+            response = self.api_client.get(self.besluittype_list_url)
+            self.assertEqual(response.status_code, 200)
+
+        for besluittype_omschrijving in ['Besluittype 2', 'Besluittype 3']:
+            BesluitTypeFactory.create(
+                maakt_deel_uit_van=self.catalogus,
+                besluittype_omschrijving=besluittype_omschrijving,
+                publicatie_indicatie=True
+            )
+
+        with CaptureQueriesContext(connection) as multiple_objects_queries:
+            response = self.api_client.get(self.besluittype_list_url)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(response.json()['results']), 3)
+        self.assertEqual(len(single_object_queries), len(multiple_objects_queries))
+
     def test_get_detail(self):
         """Retrieve the details of a single `BesluitType` object."""
         response = self.api_client.get(self.besluittype_detail_url)
@@ -65,14 +87,24 @@ class BesluitTypeAPITests(APITestCase):
             'omschrijving': 'Besluittype',
             'omschrijvingGeneriek': None,
             'publicatieIndicatie': 'J',
-            'publicatieTekst': None,
+            'publicatieTekst': '',
             'publicatieTermijn': None,
             'reactietermijn': 14,
-            'toelichting': None,
+            'toelichting': '',
             'url': 'http://testserver{}'.format(self.besluittype_detail_url),
             'wordtVastgelegdIn': []
         }
         self.assertEqual(response.json(), expected)
 
+    def test_publicatie_indicatie_nee(self):
+        """The publicatie indicatie is represented with the J/N value set of the standard."""
+        self.besluittype.publicatie_indicatie = False
+        self.besluittype.save()
+
+        response = self.api_client.get(self.besluittype_detail_url)
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(response.json()['publicatieIndicatie'], 'N')
+
     def test_wordt_vastgelegd_in(self):
         pass
@@ -1,8 +1,10 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from ...datamodel.tests.factories import (
-    InformatieObjectTypeFactory, ZaakInformatieobjectTypeFactory,
-    ZaakTypeFactory
+    BesluitTypeFactory, InformatieObjectTypeFactory,
+    ZaakInformatieobjectTypeFactory, ZaakTypeFactory
 )
 from .base import APITestCase
 
@@ -41,6 +43,40 @@ class InformatieObjectTypeAPITests(APITestCase):
         self.assertTrue('results' in data)
         self.assertEqual(len(data['results']), 1)
 
+    def test_get_list_does_not_query_per_object(self):
+        """Retrieving a list of `InformatieObjectType` objects does not do a query per (related) object."""
+        with CaptureQueriesContext(connection) as single_object_queries:
+            response = self.api_client.get(self.informatieobjecttype_list_url)
+            self.assertEqual(response.status_code, 200)
+
+        informatieobjecttypen = InformatieObjectTypeFactory.create_batch(2, maakt_deel_uit_van=self.catalogus)
+        BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus,
+            publicatie_indicatie=True,
+            wordt_vastgelegd_in=informatieobjecttypen
+        )
+
+        with CaptureQueriesContext(connection) as multiple_objects_queries:
+            response = self.api_client.get(self.informatieobjecttype_list_url)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(response.json()['results']), 3)
+        self.assertEqual(len(single_object_queries), len(multiple_objects_queries))
+
+    def test_get_list_selects_used_columns_only(self):
+        """Retrieving a list of `InformatieObjectType` objects only selects the columns of the requested fields."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get('{}?fields=url,omschrijving'.format(self.informatieobjecttype_list_url))
+            self.assertEqual(response.status_code, 200)
+
+        expected = [{
+            'omschrijving': self.informatieobjecttype.informatieobjecttype_omschrijving,
+            'url': 'http://testserver{}'.format(self.informatieobjecttype_detail_url),
+        }]
+        self.assertEqual(expected, response.json()['results'])
+        for query in queries:
+            self.assertNotIn('"datamodel_informatieobjecttype"."toelichting"', query['sql'])
+
     def test_get_detail(self):
         """Retrieve the details of a single `InformatieObjectType` object."""
         response = self.api_client.get(self.informatieobjecttype_detail_url)
@@ -88,4 +124,54 @@ class InformatieObjectTypeAPITests(APITestCase):
         )
 
     def test_is_vastlegging_voor(self):
-        pass
+        besluittype = BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus,
+            publicatie_indicatie=True,
+            wordt_vastgelegd_in=[self.informatieobjecttype]
+        )
+
+        response = self.api_client.get(self.informatieobjecttype_detail_url)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(
+            data['isVastleggingVoor'],
+            ['http://testserver{}'.format(reverse('api:besluittype-detail', args=[
+                self.API_VERSION, self.catalogus.pk, besluittype.pk
+            ]))]
+        )
+
+    def test_is_vastlegging_voor_expanded(self):
+        besluittype = BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus,
+            publicatie_indicatie=True,
+            wordt_vastgelegd_in=[self.informatieobjecttype]
+        )
+
+        response = self.api_client.get('{}?expand=isVastleggingVoor'.format(self.informatieobjecttype_detail_url))
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(len(data['isVastleggingVoor']), 1)
+        self.assertEqual(data['isVastleggingVoor'][0]['omschrijving'], besluittype.besluittype_omschrijving)
+
+    def test_is_vastlegging_voor_expanded_selects_used_columns_only(self):
+        besluittype = BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus,
+            publicatie_indicatie=True,
+            wordt_vastgelegd_in=[self.informatieobjecttype]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get(
+                '{}?expand=isVastleggingVoor.omschrijving'.format(self.informatieobjecttype_detail_url)
+            )
+            self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(data['isVastleggingVoor'], [{'omschrijving': besluittype.besluittype_omschrijving}])
+        for query in queries:
+            self.assertNotIn('"datamodel_besluittype"."toelichting"', query['sql'])
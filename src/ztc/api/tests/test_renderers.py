@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+from unittest import mock, skipIf
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.renderers import JSONRenderer
+
+from ..utils import renderers
+from ..utils.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def assertRendersLikeJSONRenderer(self, data):
+        expected = JSONRenderer().render(data, 'application/json', {})
+        self.assertEqual(ORJSONRenderer().render(data, 'application/json', {}), expected)
+
+    @skipIf(renderers.orjson is None, 'orjson is not installed')
+    def test_uses_orjson(self):
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps:
+            ORJSONRenderer().render({'a': 1}, 'application/json', {})
+
+        dumps.assert_called_once()
+
+    def test_lazy_translation(self):
+        self.assertRendersLikeJSONRenderer(OrderedDict([('omschrijving', _('Ja'))]))
+
+    def test_non_str_keys(self):
+        self.assertRendersLikeJSONRenderer(OrderedDict([(1, 'een'), (2.5, 'twee en een half'), (None, 'geen')]))
+
+    def test_lazy_translation_keys_are_rejected_like_json_renderer(self):
+        data = OrderedDict([(_('Ja'), 1)])
+
+        with self.assertRaises(TypeError):
+            JSONRenderer().render(data, 'application/json', {})
+        with self.assertRaises(TypeError):
+            ORJSONRenderer().render(data, 'application/json', {})
+
+    def test_line_and_paragraph_separators(self):
+        self.assertRendersLikeJSONRenderer(OrderedDict([('tekst', 'a\u2028b\u2029c')]))
+
+    def test_decimal_and_dates(self):
+        self.assertRendersLikeJSONRenderer(OrderedDict([
+            ('bedrag', Decimal('1.50')),
+            ('datum', date(2018, 1, 1)),
+            ('tijdstip', datetime(2018, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)),
+            ('tijd', time(12, 30, 15, 123456)),
+        ]))
+
+    def test_indent(self):
+        data = OrderedDict([('a', [1, 2])])
+
+        expected = JSONRenderer().render(data, 'application/json; indent=2', {})
+        self.assertEqual(ORJSONRenderer().render(data, 'application/json; indent=2', {}), expected)
+
+    def test_nan_is_rendered_as_null(self):
+        self.assertEqual(ORJSONRenderer().render({'a': float('nan')}, 'application/json', {}), b'{"a":null}')
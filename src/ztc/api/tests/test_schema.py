@@ -27,3 +27,15 @@ class DocumentationAPITests(ClientAPITestMixin, TransactionTestCase):
         data = json.loads(response.content.decode('utf-8'))
 
         self.assertFalse('DynamicFieldsModel' in data)
+
+    def test_schema_documents_pagination_without_count(self):
+        response = self.api_client.get('{}?format=openapi'.format(self.schema_url))
+        self.assertEqual(response.status_code, 200)
+
+        data = json.loads(response.content.decode('utf-8'))
+        operation = next(ops['get'] for path, ops in data['paths'].items() if path.endswith('/catalogussen/'))
+
+        self.assertIn('zondertelling', [parameter['name'] for parameter in operation['parameters']])
+        headers = operation['responses']['200']['headers']
+        self.assertIn('zondertelling', headers['X-Total-Count']['description'])
+        self.assertIn('zondertelling', headers['X-Pagination-Count']['description'])
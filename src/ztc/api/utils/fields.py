@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from ...datamodel.choices import JaNee
+
+
+class JaNeeField(serializers.ChoiceField):
+    """
+    Represent a boolean model field with the J/N value set of the standard.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(choices=JaNee.choices, **kwargs)
+
+    def to_internal_value(self, data):
+        return super().to_internal_value(data) == JaNee.ja
+
+    def to_representation(self, value):
+        return JaNee.ja if value else JaNee.nee
@@ -1,22 +1,82 @@
 from collections import OrderedDict
 
 from django.conf import settings
+from django.core.paginator import (
+    EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+)
+from django.utils.translation import gettext_lazy as _
 
 from drf_yasg import openapi
-from drf_yasg.inspectors import PaginatorInspector
+from drf_yasg.inspectors import CoreAPICompatInspector, NotHandled
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
+class NoCountPage(Page):
+    def __init__(self, object_list, number, paginator, next_exists):
+        super().__init__(object_list, number, paginator)
+        self.next_exists = next_exists
+
+    def has_next(self):
+        return self.next_exists
+
+
+class NoCountPaginator(Paginator):
+    """
+    Paginator that does not count the objects. One extra object is fetched to know if there is a next page.
+    """
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page number is not an integer'))
+        if number < 1:
+            raise EmptyPage(_('That page number is less than 1'))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(_('That page contains no results'))
+        return NoCountPage(object_list[:self.per_page], number, self, len(object_list) > self.per_page)
+
+
 class HALPagination(PageNumberPagination):
     page_query_param = settings.REST_FRAMEWORK_EXT.get('PAGE_PARAM', 'page')
+    no_count_query_param = settings.REST_FRAMEWORK_EXT.get('NO_COUNT_PARAM', 'nocount')
 
     header_total_count = 'X-Total-Count'
     header_pagination_count = 'X-Pagination-Count'
     header_pagination_page = 'X-Pagination-Page'
     header_pagination_limit = 'X-Pagination-Limit'
 
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate without counting the results if the `no_count_query_param` is passed (as `1` or `true`). The total
+        number of results and pages, and the link to the last page are left out of the response.
+        """
+        if request.query_params.get(self.no_count_query_param) not in ('1', 'true'):
+            return super().paginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = NoCountPaginator(queryset, page_size)
+        page_number = request.query_params.get(self.page_query_param, 1)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+        self.request = request
+        return list(self.page)
+
     def get_first_link(self):
         url = self.request.build_absolute_uri()
         return remove_query_param(url, self.page_query_param)
@@ -41,32 +101,47 @@ class HALPagination(PageNumberPagination):
                 ('first', link(self.get_first_link())),
                 ('prev', link(self.get_previous_link())),
             ])
-        if self.page.number < self.page.paginator.num_pages:
+        if self.page.has_next():
             links_data.append(
                 ('next', link(self.get_next_link())),
             )
-        if self.page.paginator.num_pages > 1:
-            links_data.append(
-                ('last', link(self.get_last_link())),
-            )
+
+        headers = OrderedDict()
+        if not isinstance(self.page.paginator, NoCountPaginator):
+            if self.page.paginator.num_pages > 1:
+                links_data.append(
+                    ('last', link(self.get_last_link())),
+                )
+
+            headers[self.header_total_count] = self.page.paginator.count
+            headers[self.header_pagination_count] = self.page.paginator.num_pages
+        headers[self.header_pagination_page] = self.page.number
+        headers[self.header_pagination_limit] = self.get_page_size(self.request)
 
         return Response(OrderedDict([
             ('_links', OrderedDict(links_data)),
             ('results', data)
-        ]), headers={
-            self.header_total_count: self.page.paginator.count,
-            self.header_pagination_count: self.page.paginator.num_pages,
-            self.header_pagination_page: self.page.number,
-            self.header_pagination_limit: self.get_page_size(self.request),
-        })
+        ]), headers=headers)
 
 
-class HALPaginationInspector(PaginatorInspector):
+class HALPaginationInspector(CoreAPICompatInspector):
     """
-    Provides response schema pagination warpping for `HALPagination`.
+    Provides the query parameters and response schema pagination warpping for `HALPagination`.
 
     Hook for `drf-yasg`.
     """
+    def get_paginator_parameters(self, paginator):
+        if not isinstance(paginator, HALPagination):
+            return NotHandled
+
+        return super().get_paginator_parameters(paginator) + [
+            openapi.Parameter(
+                paginator.no_count_query_param, openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN, required=False,
+                description='Leave out the total number of results and pages, and the link to the last page, which '
+                            'requires counting the results.'
+            ),
+        ]
+
     def get_paginated_response(self, paginator, response_schema):
         assert response_schema.type == openapi.TYPE_ARRAY, "array return expected for paged response"
         paged_schema = None
@@ -100,7 +175,8 @@ class HALPaginationInspector(PaginatorInspector):
                             ('last', openapi.Schema(
                                 type=openapi.TYPE_STRING,
                                 format=openapi.FORMAT_URI,
-                                description='URL to the last page in the result set.',
+                                description='URL to the last page in the result set. Left out if `{}` is '
+                                            'passed.'.format(paginator.no_count_query_param),
                             )),
                         )),
                         required=['self'],
@@ -111,6 +187,11 @@ class HALPaginationInspector(PaginatorInspector):
                 required=['_links', 'results'],
             )
 
+        # The counts are left out if the results are not counted.
+        no_count = 'Left out if `{}` is passed.'.format(
+            getattr(paginator, 'no_count_query_param', HALPagination.no_count_query_param)
+        )
+
         # Typically, you return a `openapi.Schema` instance. However, returning a `openapi.Response` allows us to pass
         # headers to the specification.
         # See: http://drf-yasg.readthedocs.io/en/stable/openapi.html?highlight=header#default-behavior
@@ -119,9 +200,11 @@ class HALPaginationInspector(PaginatorInspector):
             schema=paged_schema,
             headers=OrderedDict([
                 (HALPagination.header_total_count, {
-                    'type': openapi.TYPE_INTEGER, 'description': 'Total number of results.'}),
+                    'type': openapi.TYPE_INTEGER,
+                    'description': 'Total number of results. {}'.format(no_count)}),
                 (HALPagination.header_pagination_count, {
-                    'type': openapi.TYPE_INTEGER, 'description': 'Total number of pages.'}),
+                    'type': openapi.TYPE_INTEGER,
+                    'description': 'Total number of pages. {}'.format(no_count)}),
                 (HALPagination.header_pagination_page, {
                     'type': openapi.TYPE_INTEGER, 'description': 'Current page number.'}),
                 (HALPagination.header_pagination_limit, {
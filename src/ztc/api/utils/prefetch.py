@@ -0,0 +1,204 @@
+from collections import OrderedDict
+
+from django.db.models import Prefetch
+
+from rest_framework import serializers
+from rest_framework.relations import (
+    HyperlinkedRelatedField, ManyRelatedField, RelatedField
+)
+from rest_framework_nested.relations import NestedHyperlinkedRelatedField
+
+from .relations import (
+    NestedHyperlinkedRelatedField as TemplatedNestedHyperlinkedRelatedField
+)
+
+
+def get_relation(model, name):
+    """
+    Returns the relation field on `model` that is accessed via the attribute `name`, or `None` if `name` is not a
+    relation. Reverse relations are matched on their accessor name (like `besluittype_set`).
+    """
+    for field in model._meta.get_fields():
+        if not field.is_relation:
+            continue
+        if field.auto_created and not field.concrete:
+            accessor_name = field.get_accessor_name()
+        else:
+            accessor_name = field.name
+        if accessor_name == name:
+            return field
+    return None
+
+
+def get_field_paths(field, attrs=None):
+    """
+    Returns a list of `(attrs, nested_paths)` tuples, describing the attributes that are traversed to represent `field`
+    and the paths (in the same format) that are traversed from the object at the end of those attributes.
+    """
+    if attrs is None:
+        attrs = [attr for attr in field.source_attrs if attr]
+
+    if isinstance(field, serializers.ListSerializer):
+        return [(attrs, get_serializer_paths(field.child))]
+    if isinstance(field, serializers.Serializer):
+        return [(attrs, get_serializer_paths(field))]
+    if isinstance(field, ManyRelatedField):
+        # The child relation represents each related object, its own `source` is that of the many related field.
+        return [(attrs, get_field_paths(field.child_relation, attrs=[]))]
+    if isinstance(field, TemplatedNestedHyperlinkedRelatedField):
+        # Parent lookups ending in the primary key of a related object are read from the foreign key column.
+        paths = [(attrs + [field.lookup_field], [])]
+        for lookup in field.parent_lookup_kwargs.values():
+            lookups = lookup.split('__')
+            if len(lookups) > 1 and lookups[-1] == 'pk':
+                lookups = lookups[:-2] + ['{}_id'.format(lookups[-2])]
+            paths.append((attrs + lookups, []))
+        return paths
+    if isinstance(field, NestedHyperlinkedRelatedField):
+        # The URL of a nested resource is built by following the parent lookups from the related object.
+        paths = [(attrs + [field.lookup_field], [])]
+        paths.extend((attrs + lookup.split('__'), []) for lookup in field.parent_lookup_kwargs.values())
+        return paths
+    if isinstance(field, RelatedField) and field.use_pk_only_optimization():
+        if not attrs:
+            # A child relation of a many related field is represented by the primary key of the related object.
+            return [(['pk'], [])]
+        # Only the primary key of the last relation is used, which is read from the foreign key column.
+        return [(attrs[:-1] + ['{}_id'.format(attrs[-1])], [])]
+    if isinstance(field, HyperlinkedRelatedField):
+        return [(attrs + [field.lookup_field], [])]
+    return [(attrs, [])]
+
+
+def get_serializer_paths(serializer):
+    """
+    Returns the paths, as described in `get_field_paths`, of all fields of `serializer`.
+    """
+    paths = []
+    for field in serializer.fields.values():
+        paths.extend(get_field_paths(field))
+    return paths
+
+
+def _add_path(model, attrs, nested_paths, select_related, prefetch_related, prefix=''):
+    lookup = prefix
+    for i, attr in enumerate(attrs):
+        relation = get_relation(model, attr)
+        if relation is None:
+            return
+
+        lookup = '{}__{}'.format(lookup, attr) if lookup else attr
+        model = relation.related_model
+
+        if relation.many_to_many or relation.one_to_many:
+            # Everything beyond a multi-valued relation is resolved in the `Prefetch` queryset.
+            _, paths = prefetch_related.setdefault(lookup, (relation, []))
+            if attrs[i + 1:]:
+                paths.append((attrs[i + 1:], nested_paths))
+            else:
+                paths.extend(nested_paths)
+            return
+
+        select_related.add(lookup)
+
+    for nested_attrs, nested_nested_paths in nested_paths:
+        _add_path(model, nested_attrs, nested_nested_paths, select_related, prefetch_related, prefix=lookup)
+
+
+def get_column(model, name):
+    """
+    Returns the concrete field of `model` whose column is read via the attribute `name`, like `pk`, `toelichting` or
+    `maakt_deel_uit_van_id`. Returns `None` otherwise.
+    """
+    if name == 'pk':
+        return model._meta.pk
+    for field in model._meta.concrete_fields:
+        if name in (field.name, field.attname):
+            return field
+    return None
+
+
+def _add_only_fields(model, attrs, nested_paths, only, prefix=()):
+    for attr in attrs:
+        relation = get_relation(model, attr)
+        if relation is None:
+            field = get_column(model, attr)
+            if field is None:
+                return False
+            only.add('__'.join(prefix + (field.name,)))
+            return True
+
+        if relation.many_to_many or relation.one_to_many:
+            # Multi-valued relations are resolved in a separate query.
+            return True
+        if not relation.concrete:
+            return False
+
+        prefix += (relation.name,)
+        only.add('__'.join(prefix))
+        model = relation.related_model
+
+    if not nested_paths:
+        # The object itself is used in the representation.
+        return False
+    return all(
+        _add_only_fields(model, nested_attrs, nested_nested_paths, only, prefix=prefix)
+        for nested_attrs, nested_nested_paths in nested_paths
+    )
+
+
+def get_only_fields(model, paths):
+    """
+    Returns the field names for `QuerySet.only` if all `paths` of `model` end in a database column. Returns `None` if
+    any path needs another attribute of an object, which might depend on a deferred field.
+    """
+    only = {model._meta.pk.name}
+    for attrs, nested_paths in paths:
+        if not _add_only_fields(model, attrs, nested_paths, only):
+            return None
+    return only
+
+
+def _optimize_paths(queryset, paths):
+    select_related = set()
+    prefetch_related = OrderedDict()
+
+    for attrs, nested_paths in paths:
+        _add_path(queryset.model, attrs, nested_paths, select_related, prefetch_related)
+
+    if select_related:
+        queryset = queryset.select_related(*sorted(select_related))
+
+    prefetches = []
+    for lookup, (relation, related_paths) in prefetch_related.items():
+        related_model = relation.related_model
+        related_queryset = _optimize_paths(related_model._default_manager.all(), related_paths)
+
+        only = get_only_fields(related_model, related_paths)
+        if only is not None:
+            if relation.one_to_many:
+                # The prefetched objects are matched on the foreign key, which should not be deferred.
+                only.add(relation.field.name)
+            related_queryset = related_queryset.only(*sorted(only))
+
+        prefetches.append(Prefetch(lookup, queryset=related_queryset))
+
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+
+    return queryset
+
+
+def optimize_queryset(queryset, serializer):
+    """
+    Applies `select_related` for the forward relations and `prefetch_related` for the reverse and many-to-many
+    relations that `serializer` traverses to represent the objects in `queryset`, and limits the selected columns to
+    the ones that are used.
+    """
+    paths = get_serializer_paths(serializer)
+    queryset = _optimize_paths(queryset, paths)
+
+    only = get_only_fields(queryset.model, paths)
+    if only is not None:
+        queryset = queryset.only(*sorted(only))
+    return queryset
@@ -0,0 +1,68 @@
+from functools import reduce
+from urllib.parse import quote
+
+from django.urls import NoReverseMatch
+from django.utils.http import RFC3986_SUBDELIMS
+
+from rest_framework_nested import relations
+
+
+def get_lookup_value(obj, lookup):
+    """
+    Follow the `__` separated `lookup` from `obj`, like `NestedHyperlinkedRelatedField` does. If the lookup ends in
+    the primary key of a related object, the value is read from the foreign key column instead, which avoids fetching
+    the related object.
+    """
+    lookups = lookup.split('__')
+    if len(lookups) > 1 and lookups[-1] == 'pk':
+        parent = reduce(getattr, [obj] + lookups[:-2])
+        field = parent._meta.get_field(lookups[-2])
+        if field.many_to_one and field.target_field.primary_key:
+            return getattr(parent, field.attname)
+    return reduce(getattr, [obj] + lookups)
+
+
+class NestedHyperlinkedRelatedField(relations.NestedHyperlinkedRelatedField):
+    """
+    Reverse the URL once, with placeholders for the URL keyword arguments, and fill in the values of each object in
+    the resulting template. Resolving the URL for every object is expensive when representing lists.
+    """
+    def get_url_template(self, view_name, request, format):
+        key = (view_name, request, format)
+        if getattr(self, '_url_template_key', None) != key:
+            url_kwargs = [self.lookup_url_kwarg] + list(self.parent_lookup_kwargs.keys())
+            placeholders = {url_kwarg: '__placeholder_{}__'.format(url_kwarg) for url_kwarg in url_kwargs}
+            try:
+                url = self.reverse(view_name, kwargs=dict(placeholders), request=request, format=format)
+            except NoReverseMatch:
+                # The placeholders don't match the URL pattern, fall back to reversing the URL per object.
+                url = None
+
+            self._url_template_key = key
+            self._url_template = (url, placeholders)
+        return self._url_template
+
+    def get_url(self, obj, view_name, request, format):
+        # Unsaved objects will not yet have a valid URL.
+        if hasattr(obj, 'pk') and obj.pk in (None, ''):
+            return None
+
+        url, placeholders = self.get_url_template(view_name, request, format)
+        if url is None:
+            return super().get_url(obj, view_name, request, format)
+
+        kwargs = {self.lookup_url_kwarg: getattr(obj, self.lookup_field)}
+        for parent_lookup_kwarg, underscored_lookup in self.parent_lookup_kwargs.items():
+            kwargs[parent_lookup_kwarg] = get_lookup_value(obj, underscored_lookup)
+
+        for url_kwarg, value in kwargs.items():
+            url = url.replace(placeholders[url_kwarg], quote(str(value), safe=RFC3986_SUBDELIMS + '/~:@'))
+        return url
+
+
+class NestedHyperlinkedIdentityField(NestedHyperlinkedRelatedField):
+    def __init__(self, view_name=None, **kwargs):
+        assert view_name is not None, 'The `view_name` argument is required.'
+        kwargs['read_only'] = True
+        kwargs['source'] = '*'
+        super().__init__(view_name=view_name, **kwargs)
@@ -0,0 +1,38 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render compact JSON with `orjson`, which is considerably faster than the standard library `json` module.
+
+    Falls back to the original renderer if `orjson` is not installed, if the output should be pretty printed or ASCII
+    only, or if NaN and Infinity should be rendered (non-strict JSON), which `orjson` doesn't support. In strict mode,
+    `orjson` renders NaN and Infinity as `null`, where the original renderer raises a `ValueError`.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return bytes()
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None or self.ensure_ascii or not self.compact or not self.strict:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Types that `orjson` doesn't know, like lazy translations and decimals, are handled by the REST framework
+        # encoder. Dates and times are passed to it as well, as it formats them differently.
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except orjson.JSONEncodeError:
+            # Like keys that are lazy translations, let the original renderer handle (or reject) those.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # We always fully escape \u2028 and \u2029 to ensure we output JSON that is a strict javascript subset, like
+        # the original renderer does.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,4 +1,5 @@
 import importlib
+from functools import lru_cache
 
 from django.conf import settings
 
@@ -11,6 +12,25 @@ FIELDS_PARAM = settings.REST_FRAMEWORK_EXT.get('FIELDS_PARAM', 'fields')
 EXPAND_ALL_VALUE = settings.REST_FRAMEWORK_EXT.get('EXPAND_ALL_VALUE', '~all')
 
 
+@lru_cache(maxsize=None)
+def import_serializer_class(location):
+    """
+    Resolves dot-notation string reference to serializer class and returns actual class.
+
+    <app>.<SerializerName> will automatically be interpreted as <app>.serializers.<SerializerName>
+
+    The serializers refer to each other, so they can't be resolved when the classes are created. Instead, each
+    reference is resolved once, the first time it's expanded.
+    """
+    pieces = location.split('.')
+    class_name = pieces.pop()
+    if pieces[len(pieces) - 1] != 'serializers':
+        pieces.append('serializers')
+
+    module = importlib.import_module('.'.join(pieces))
+    return getattr(module, class_name)
+
+
 class FlexFieldsMixin(_FlexFieldsMixin):
     """
     Extended the original mixin.
@@ -19,6 +39,7 @@ class FlexFieldsMixin(_FlexFieldsMixin):
 
         * Added settings to get params.
         * Add `expand` and `fields` parameters to the documentation.
+        * The params are parsed, and the serializer class is created, once per request.
 
     """
 
@@ -56,6 +77,33 @@ class FlexFieldsMixin(_FlexFieldsMixin):
 
         return super().list(request, *args, **kwargs)
 
+    def get_serializer_class(self):
+        """
+        Dynamically adds properties to `serializer_class` from the request's GET params. The serializer class is
+        requested more than once per request, like when optimizing the queryset for it.
+        """
+        request = getattr(self, 'request', None)
+        if request is None or request.method != 'GET':
+            return self.serializer_class
+
+        if getattr(self, '_dynamic_serializer_class_request', None) is not request:
+            fields = request.query_params.get(FIELDS_PARAM)
+            fields = fields.split(',') if fields else None
+
+            expand = None
+            if self._expandable:
+                expand = request.query_params.get(EXPAND_PARAM)
+                expand = expand.split(',') if expand else None
+            elif len(self._force_expand) > 0:
+                expand = self._force_expand
+
+            self._dynamic_serializer_class = type('DynamicFieldsModelSerializer', (self.serializer_class,), {
+                'expand': expand,
+                'include_fields': fields,
+            })
+            self._dynamic_serializer_class_request = request
+        return self._dynamic_serializer_class
+
 
 class FlexFieldsSerializerMixin(object):
     """
@@ -65,6 +113,7 @@ class FlexFieldsSerializerMixin(object):
 
         * Added settings to get params.
         * Added feature to add the name to the inclusion fields, if its not expandable.
+        * The dot-notation references to serializer classes are only resolved once.
 
     """
     expandable_fields = {}
@@ -125,16 +174,8 @@ class FlexFieldsSerializerMixin(object):
     def _import_serializer_class(self, location):
         """
         Resolves dot-notation string reference to serializer class and returns actual class.
-
-        <app>.<SerializerName> will automatically be interpreted as <app>.serializers.<SerializerName>
         """
-        pieces = location.split('.')
-        class_name = pieces.pop()
-        if pieces[ len(pieces)-1 ] != 'serializers':
-            pieces.append('serializers')
-
-        module = importlib.import_module( '.'.join(pieces) )
-        return getattr(module, class_name)
+        return import_serializer_class(location)
 
     def _clean_fields(self, include_fields):
         if include_fields:
@@ -145,7 +186,7 @@ class FlexFieldsSerializerMixin(object):
             for field_name in existing_fields - allowed_fields:
                 self.fields.pop(field_name)
 
-            self._expandable = list( existing_expandable_fields & allowed_fields )
+            self._expandable = existing_expandable_fields & allowed_fields
 
     def _split_levels(self, fields):
         """
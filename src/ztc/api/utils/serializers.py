@@ -1,7 +1,23 @@
+from collections import OrderedDict
+from operator import attrgetter
+
+from django.utils.functional import cached_property
+
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework_nested import serializers
+
+from .relations import NestedHyperlinkedIdentityField
+
+
 class SourceMappingSerializerMixin(object):
     """
     Read the `Meta.source_mapping` attribute and fill the `extra_kwargs` with
     the appropriate `source` argument.
+
+    The fields are represented following a plan that is built once per
+    serializer, and fields that represent a model column are read with a
+    precompiled getter.
     """
     def get_extra_kwargs(self):
         extra_kwargs = super().get_extra_kwargs()
@@ -19,3 +35,50 @@ class SourceMappingSerializerMixin(object):
                 extra_kwargs[field_name] = kwargs
 
         return extra_kwargs
+
+    @cached_property
+    def _representation_plan(self):
+        """
+        Return a `(field_name, getter, to_representation)` tuple for each readable field, with the bound methods looked
+        up once instead of for every object. Fields that represent a (mapped) model column get a getter that skips the
+        generic attribute lookup that the field does for every object.
+        """
+        opts = self.Meta.model._meta
+        columns = {field.name for field in opts.concrete_fields if not field.is_relation}
+
+        plan = []
+        for field in self._readable_fields:
+            getter = field.get_attribute
+            if type(field).get_attribute is Field.get_attribute:
+                if len(field.source_attrs) == 1 and field.source_attrs[0] in columns:
+                    getter = attrgetter(field.source_attrs[0])
+            plan.append((field.field_name, getter, field.to_representation))
+        return tuple(plan)
+
+    def to_representation(self, instance):
+        if not isinstance(instance, self.Meta.model):
+            return super().to_representation(instance)
+
+        ret = OrderedDict()
+
+        for field_name, getter, to_representation in self._representation_plan:
+            try:
+                attribute = getter(instance)
+            except SkipField:
+                continue
+
+            # See `rest_framework.serializers.Serializer.to_representation`.
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = to_representation(attribute)
+
+        return ret
+
+
+class NestedHyperlinkedModelSerializer(serializers.NestedHyperlinkedModelSerializer):
+    """
+    Use the `NestedHyperlinkedIdentityField` that fills in a URL template for the `url` field.
+    """
+    serializer_url_field = NestedHyperlinkedIdentityField
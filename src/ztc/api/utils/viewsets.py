@@ -1,3 +1,6 @@
+from .prefetch import optimize_queryset
+
+
 class FilterSearchOrderingViewSetMixin(object):
     """
     Consult the model options to set filter-, ordering- and search fields.
@@ -59,3 +62,13 @@ class NestedViewSetMixin(object):
                 orm_filters[field_name] = self.kwargs[query_param]
             return queryset.filter(**orm_filters)
         return queryset
+
+
+class AutoPrefetchViewSetMixin(object):
+    """
+    Consult the serializer fields to ``select_related`` and ``prefetch_related`` the relations that are used to
+    represent each object, to avoid doing a query per object. Only the columns that are used are selected.
+    """
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        return optimize_queryset(queryset, self.get_serializer())
@@ -4,11 +4,12 @@ from rest_framework import viewsets
 from ...datamodel.models import BesluitType
 from ..serializers import BesluitTypeSerializer
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    AutoPrefetchViewSetMixin, FilterSearchOrderingViewSetMixin,
+    NestedViewSetMixin
 )
 
 
-class BesluitTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class BesluitTypeViewSet(NestedViewSetMixin, AutoPrefetchViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Generieke aanduiding van de aard van een besluit.
@@ -4,11 +4,12 @@ from ...datamodel.models import InformatieObjectType
 from ..serializers import InformatieObjectTypeSerializer
 from ..utils.rest_flex_fields import FlexFieldsMixin
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    AutoPrefetchViewSetMixin, FilterSearchOrderingViewSetMixin,
+    NestedViewSetMixin
 )
 
 
-class InformatieObjectTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class InformatieObjectTypeViewSet(NestedViewSetMixin, AutoPrefetchViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Aanduiding van de aard van INFORMATIEOBJECTen zoals gehanteerd door de zaakbehandelende organisatie.
@@ -327,7 +327,7 @@ OAUTH2_PROVIDER = {
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'ztc.api.utils.renderers.ORJSONRenderer',
         # 'rest_framework.renderers.BrowsableAPIRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
@@ -436,6 +436,7 @@ REST_FRAMEWORK = {
 
 REST_FRAMEWORK_EXT = {
     'PAGE_PARAM': 'pagina',
+    'NO_COUNT_PARAM': 'zondertelling',
     'EXPAND_PARAM': 'expand',
     'EXPAND_ALL_VALUE': 'true',
     'FIELDS_PARAM': 'fields',
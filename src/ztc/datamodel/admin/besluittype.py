@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
 from ..models import BesluitType
 from .mixins import FilterSearchOrderingAdminMixin, GeldigheidAdminMixin
@@ -38,3 +38,21 @@ class BesluitTypeAdmin(GeldigheidAdminMixin, FilterSearchOrderingAdminMixin, adm
         }),
     )
     filter_horizontal = ('wordt_vastgelegd_in', )
+
+    def changeform_view(self, request, *args, **kwargs):
+        request.besluittype_change_form = True
+        return super().changeform_view(request, *args, **kwargs)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if getattr(request, 'besluittype_change_form', False):
+            # The change form shows the CATALOGUS in its title and selects the related INFORMATIEOBJECTTYPEn by
+            # primary key, so fetch those in advance (`with_related_minimal` includes their omschrijving as well).
+            queryset = queryset.with_related_minimal()
+        return queryset
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == 'wordt_vastgelegd_in':
+            # The choices are shown with their CATALOGUS (see `InformatieObjectType.__str__`).
+            kwargs['queryset'] = db_field.related_model._default_manager.select_related('maakt_deel_uit_van')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
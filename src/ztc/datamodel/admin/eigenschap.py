@@ -1,16 +1,21 @@
 from django.contrib import admin
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
 from ..models import Eigenschap, EigenschapReferentie, EigenschapSpecificatie
-from .mixins import FilterSearchOrderingAdminMixin, GeldigheidAdminMixin
+from .mixins import (
+    CachedSearchResultsAdminMixin, FilterSearchOrderingAdminMixin,
+    GeldigheidAdminMixin
+)
 
 
 @admin.register(Eigenschap)
-class EigenschapAdmin(GeldigheidAdminMixin, FilterSearchOrderingAdminMixin, admin.ModelAdmin):
+class EigenschapAdmin(GeldigheidAdminMixin, FilterSearchOrderingAdminMixin, CachedSearchResultsAdminMixin, admin.ModelAdmin):
     model = Eigenschap
 
     # List
     list_display = ('eigenschapnaam', 'is_van')
+    list_select_related = ('is_van__maakt_deel_uit_van', )
+    show_full_result_count = False
 
     # Details
     fieldsets = (
@@ -29,12 +34,14 @@ class EigenschapAdmin(GeldigheidAdminMixin, FilterSearchOrderingAdminMixin, admi
             )
         }),
     )
+    raw_id_fields = ('is_van', 'specificatie_van_eigenschap', 'referentie_naar_eigenschap', )
 
 
 @admin.register(EigenschapReferentie)
-class EigenschapReferentieAdmin(admin.ModelAdmin):
+class EigenschapReferentieAdmin(CachedSearchResultsAdminMixin, admin.ModelAdmin):
     # List
     list_display = ('objecttype', 'informatiemodel', )  # Add is_van
+    show_full_result_count = False
     # list_filter = ('rsin', )  # Add is_van
     search_fields = (
         'objecttype',
@@ -61,9 +68,10 @@ class EigenschapReferentieAdmin(admin.ModelAdmin):
 
 
 @admin.register(EigenschapSpecificatie)
-class EigenschapSpecificatieAdmin(admin.ModelAdmin):
+class EigenschapSpecificatieAdmin(CachedSearchResultsAdminMixin, admin.ModelAdmin):
     # List
     list_display = ('groep', 'formaat', 'lengte', 'kardinaliteit', )  # Add is_van
+    show_full_result_count = False
     # list_filter = ('rsin', )  # Add is_van
     search_fields = (
         'groep',
@@ -1,6 +1,9 @@
+import hashlib
+
 from django.contrib.admin.widgets import AdminDateWidget
-from django.core.exceptions import ImproperlyConfigured
-from django.utils.translation import ugettext_lazy as _
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured
+from django.utils.translation import gettext_lazy as _
 
 from ...utils.fields import StUFDateField
 
@@ -47,3 +50,40 @@ class FilterSearchOrderingAdminMixin(object):
         The fields that are searched in the admin.
         """
         return self.get_model_option('search_fields', super().get_search_fields(request))
+
+
+class CachedSearchResultsAdminMixin(object):
+    """
+    Cache the primary keys of the search results for a short while, so repeated searches (like while paging through
+    the results or typing in an autocomplete field) don't search all the search fields again.
+    """
+    search_results_cache_timeout = 30
+    search_results_cache_limit = 200
+
+    def get_search_results_cache_key(self, request, queryset, search_term):
+        try:
+            query = str(queryset.query)
+        except EmptyResultSet:
+            return None
+
+        key = '\n'.join([search_term, ','.join(self.get_search_fields(request)), query])
+        return 'admin-search-results:{}:{}'.format(
+            self.model._meta.label_lower, hashlib.md5(key.encode('utf-8')).hexdigest()
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+
+        cache_key = self.get_search_results_cache_key(request, queryset, search_term)
+        pks = cache.get(cache_key) if cache_key else None
+        if pks is not None:
+            return queryset.filter(pk__in=pks), False
+
+        results, use_distinct = super().get_search_results(request, queryset, search_term)
+        if cache_key:
+            pks = list(results.order_by().values_list('pk', flat=True).distinct()[:self.search_results_cache_limit + 1])
+            # Only small result sets are cached, to keep the cache entries small.
+            if len(pks) <= self.search_results_cache_limit:
+                cache.set(cache_key, pks, self.search_results_cache_timeout)
+        return results, use_distinct
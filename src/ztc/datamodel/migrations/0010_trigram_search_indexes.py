@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# The columns that are searched in the admin. The admin searches with `icontains`, which is translated to
+# `UPPER("column"::text) LIKE UPPER(%s)`, so the trigram index is created on that expression.
+SEARCH_FIELDS = {
+    'datamodel_eigenschap': [
+        'eigenschapnaam',
+        'definitie',
+        'toelichting',
+    ],
+    'datamodel_eigenschapreferentie': [
+        'objecttype',
+        'informatiemodel',
+        'namespace',
+        'schemalocatie',
+        'x_path_element',
+        'entiteittype',
+    ],
+    'datamodel_eigenschapspecificatie': [
+        'groep',
+    ],
+}
+
+
+def trigram_index_operations():
+    operations = []
+    for table, columns in SEARCH_FIELDS.items():
+        for column in columns:
+            index_name = '{}_{}_trgm'.format(table, column)
+            operations.append(migrations.RunSQL(
+                'CREATE INDEX "{}" ON "{}" USING gin (UPPER("{}"::text) gin_trgm_ops);'.format(
+                    index_name, table, column
+                ),
+                'DROP INDEX "{}";'.format(index_name),
+            ))
+    return operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0009_auto_20180517_1642'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ] + trigram_index_operations()
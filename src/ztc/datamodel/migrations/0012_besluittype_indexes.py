@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2026-10-15 21:52
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0011_catalogus_rsin_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='besluittype',
+            index=models.Index(fields=['besluittype_omschrijving'], name='datamodel_b_besluit_2e6802_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='besluittype',
+            index=models.Index(fields=['besluitcategorie'], name='datamodel_b_besluit_aabddd_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2026-10-15 21:52
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0012_besluittype_indexes'),
+    ]
+
+    operations = [
+        # Altering the fields fills in the default for existing NULL values. Those updates queue the checks of the
+        # deferred foreign keys, after which PostgreSQL refuses to alter the table again in the same transaction, so
+        # the constraints are checked immediately instead.
+        migrations.RunSQL('SET CONSTRAINTS ALL IMMEDIATE', migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name='besluittype',
+            name='publicatietekst',
+            field=models.TextField(blank=True, default='', help_text='De generieke tekst van de publicatie van BESLUITen van dit BESLUITTYPE', max_length=1000, verbose_name='publicatietekst'),
+        ),
+        migrations.AlterField(
+            model_name='besluittype',
+            name='toelichting',
+            field=models.TextField(blank=True, default='', help_text='Een eventuele toelichting op dit BESLUITTYPE.', max_length=1000, verbose_name='toelichting'),
+        ),
+    ]
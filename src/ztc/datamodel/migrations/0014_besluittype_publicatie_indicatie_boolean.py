@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+def forward(apps, schema_editor):
+    BesluitType = apps.get_model('datamodel', 'BesluitType')
+
+    BesluitType.objects.filter(publicatie_indicatie='J').update(publicatie_indicatie_new=True)
+
+
+def backward(apps, schema_editor):
+    BesluitType = apps.get_model('datamodel', 'BesluitType')
+
+    BesluitType.objects.filter(publicatie_indicatie_new=True).update(publicatie_indicatie='J')
+    BesluitType.objects.filter(publicatie_indicatie_new=False).update(publicatie_indicatie='N')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0013_besluittype_text_fields'),
+    ]
+
+    operations = [
+        # The data is updated between altering the table, which PostgreSQL refuses while checks of deferred foreign
+        # keys are pending (see 0013). The operations run in reverse order when unapplying the migration.
+        migrations.RunSQL('SET CONSTRAINTS ALL IMMEDIATE', migrations.RunSQL.noop),
+        migrations.AddField(
+            model_name='besluittype',
+            name='publicatie_indicatie_new',
+            field=models.BooleanField(default=False),
+            preserve_default=False,
+        ),
+        # When reversing, the old column is added again before it is filled, so it has to allow NULL until then.
+        migrations.AlterField(
+            model_name='besluittype',
+            name='publicatie_indicatie',
+            field=models.CharField(choices=[('J', 'Ja'), ('N', 'Nee')], help_text='Aanduiding of BESLUITen van dit BESLUITTYPE gepubliceerd moeten worden.', max_length=1, null=True, verbose_name='publicatie indicatie'),
+        ),
+        migrations.RunPython(forward, backward),
+        migrations.RemoveField(
+            model_name='besluittype',
+            name='publicatie_indicatie',
+        ),
+        migrations.RenameField(
+            model_name='besluittype',
+            old_name='publicatie_indicatie_new',
+            new_name='publicatie_indicatie',
+        ),
+        migrations.AlterField(
+            model_name='besluittype',
+            name='publicatie_indicatie',
+            field=models.BooleanField(help_text='Aanduiding of BESLUITen van dit BESLUITTYPE gepubliceerd moeten worden.', verbose_name='publicatie indicatie'),
+        ),
+        migrations.RunSQL(migrations.RunSQL.noop, 'SET CONSTRAINTS ALL IMMEDIATE'),
+    ]
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+# The maximum of the termijnen is validated by the model fields, which is skipped when saving without validation (like
+# `bulk_create`). Django 1.11 can't declare check constraints on models, so they are added here. NULL values pass.
+CHECKS = {
+    'datamodel_besluittype_reactietermijn_max': '"reactietermijn" <= 999',
+    'datamodel_besluittype_publicatietermijn_max': '"publicatietermijn" <= 999',
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0014_besluittype_publicatie_indicatie_boolean'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'ALTER TABLE "datamodel_besluittype" ADD CONSTRAINT "{}" CHECK ({});'.format(name, check),
+            'ALTER TABLE "datamodel_besluittype" DROP CONSTRAINT "{}";'.format(name),
+        )
+        for name, check in sorted(CHECKS.items())
+    ]
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+# Only few besluittypen are published, so a partial index on the published besluittypen is small and selective. Django
+# 1.11 can't declare partial indexes on models, so it is created here. The `besluitcategorie` already has an index
+# (see 0012).
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0015_besluittype_termijn_checks'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX "datamodel_besluittype_gepubliceerd_idx" ON "datamodel_besluittype" ("publicatie_indicatie") '
+            'WHERE "publicatie_indicatie";',
+            'DROP INDEX "datamodel_besluittype_gepubliceerd_idx";',
+        ),
+    ]
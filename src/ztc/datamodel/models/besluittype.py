@@ -1,13 +1,51 @@
-from datetime import timedelta
-
-from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
 from django.db import models
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
-from ..choices import JaNee
 from .mixins import GeldigheidMixin
 
+# De reactie- en publicatietermijn zijn beide 0-999 dagen.
+MAX_TERMIJN_VALIDATOR = MaxValueValidator(999)
+
+
+class BesluitTypeQuerySet(models.QuerySet):
+    def with_related_minimal(self):
+        """
+        Fetch the CATALOGUS, used in `BesluitType.__str__`, and the primary key and omschrijving of the
+        INFORMATIEOBJECTTYPEn in advance, to avoid doing a query per BESLUITTYPE.
+        """
+        informatieobjecttypen = self.model._meta.get_field('wordt_vastgelegd_in').related_model._default_manager.only(
+            'id', 'informatieobjecttype_omschrijving'
+        )
+        return self.select_related('maakt_deel_uit_van').prefetch_related(
+            models.Prefetch('wordt_vastgelegd_in', queryset=informatieobjecttypen)
+        )
+
+    def bulk_load(self, rows, batch_size=1000):
+        """
+        Create a BESLUITTYPE for each `dict` of field values in `rows`, with one INSERT per `batch_size` rows. Rows with
+        the same CATALOGUS and omschrijving as an existing BESLUITTYPE, or an earlier row, are skipped.
+
+        The many-to-many relations can't be set this way.
+        """
+        objs = [self.model(**row) for row in rows]
+
+        catalogus_ids = {obj.maakt_deel_uit_van_id for obj in objs}
+        existing = self.filter(maakt_deel_uit_van__in=catalogus_ids).exclude(besluittype_omschrijving=None).order_by()
+        existing = set(existing.values_list('maakt_deel_uit_van', 'besluittype_omschrijving'))
+
+        new_objs = []
+        for obj in objs:
+            key = (obj.maakt_deel_uit_van_id, obj.besluittype_omschrijving)
+            if key in existing:
+                continue
+            # Multiple rows without an omschrijving don't conflict.
+            if obj.besluittype_omschrijving is not None:
+                existing.add(key)
+            new_objs.append(obj)
+
+        return self.bulk_create(new_objs, batch_size=batch_size)
+
 
 class BesluitType(GeldigheidMixin, models.Model):
     """
@@ -34,21 +72,21 @@ class BesluitType(GeldigheidMixin, models.Model):
     # TODO [KING]: Kardinaliteit is 1-1, maar in de toelichting staat: "De telling begint bij de dag volgend op de verzend- of publicatiedatum.
     # Indien geen sprake is van een reactietermijn dan is de waarde nul." Als 0 wordt ingevuld is er dus een reactietermijn van 0 dagen. Moet er ook een optie None/leeg zijn, anders dan 0 dagen?
     reactietermijn = models.PositiveSmallIntegerField(
-        _('reactietermijn'), validators=[MaxValueValidator(999)],
+        _('reactietermijn'), validators=[MAX_TERMIJN_VALIDATOR],
         help_text=_('Het aantal dagen, gerekend vanaf de verzend- of publicatiedatum, waarbinnen verweer tegen '
                     'een besluit van het besluittype mogelijk is.'))
-    publicatie_indicatie = models.CharField(
-        _('publicatie indicatie'), max_length=1, choices=JaNee.choices,
+    publicatie_indicatie = models.BooleanField(
+        _('publicatie indicatie'),
         help_text=_('Aanduiding of BESLUITen van dit BESLUITTYPE gepubliceerd moeten worden.'))
-    publicatietekst = models.CharField(
-        _('publicatietekst'), max_length=1000, blank=True, null=True,
+    publicatietekst = models.TextField(
+        _('publicatietekst'), max_length=1000, blank=True, default='',
         help_text=_('De generieke tekst van de publicatie van BESLUITen van dit BESLUITTYPE'))
     publicatietermijn = models.PositiveSmallIntegerField(
-        _('publicatietermijn'), blank=True, null=True, validators=[MaxValueValidator(999)],
+        _('publicatietermijn'), blank=True, null=True, validators=[MAX_TERMIJN_VALIDATOR],
         help_text=_('Het aantal dagen, gerekend vanaf de verzend- of publicatiedatum, dat BESLUITen van dit '
                     'BESLUITTYPE gepubliceerd moeten blijven.'))
-    toelichting = models.CharField(
-        _('toelichting'), max_length=1000, blank=True, null=True,
+    toelichting = models.TextField(
+        _('toelichting'), max_length=1000, blank=True, default='',
         help_text=_('Een eventuele toelichting op dit BESLUITTYPE.'))
 
     maakt_deel_uit_van = models.ForeignKey(
@@ -65,12 +103,20 @@ class BesluitType(GeldigheidMixin, models.Model):
         'datamodel.ZaakType', verbose_name=_('zaaktypes'), related_name='heeft_relevant_besluittype',
         help_text=_('ZAAKTYPE met ZAAKen die relevant kunnen zijn voor dit BESLUITTYPE'))
 
+    objects = BesluitTypeQuerySet.as_manager()
+
     class Meta:
         mnemonic = 'BST'
         unique_together = ('maakt_deel_uit_van', 'besluittype_omschrijving')
         verbose_name = _('Besluittype')
         verbose_name_plural = _('Besluittypen')
         ordering = unique_together
+        # The unique constraint already provides an index on (`maakt_deel_uit_van`, `besluittype_omschrijving`), which
+        # is not used for lookups on `besluittype_omschrijving` alone. The admin also sorts on `besluitcategorie`.
+        indexes = [
+            models.Index(fields=['besluittype_omschrijving']),
+            models.Index(fields=['besluitcategorie']),
+        ]
 
         filter_fields = (
             'maakt_deel_uit_van',
@@ -90,26 +136,7 @@ class BesluitType(GeldigheidMixin, models.Model):
         """
         return '{} - {}'.format(self.maakt_deel_uit_van, self.besluittype_omschrijving)
 
-    def clean(self):
-        """
-        datum_begin_geldigheid is gelijk aan een Versiedatum van een gerelateerd zaaktype.
-
-        datum_einde_geldigheid is gelijk aan de dag voor een Versiedatum van een gerelateerd zaaktype.
-        """
-        super().clean()
-        # TODO: review this, see GeldigheidsMixin.clean
-        # TODO: many to many can not be validated in model.clean, we need to use a form (self.zaaktypes)
-        # if self.datum_begin_geldigheid:
-        #     # it is required, if it was not filled in, validation error from the field will be raised
-        #     zaaktype_versiedatums = list(set(self.zaaktypes.values_list('versiedatum', flat=True)))
-        #     # use the 'onvolledige datums', do not convert to python datetime.date for this comparision
-        #     if self.datum_begin_geldigheid not in zaaktype_versiedatums:
-        #         raise ValidationError(_('Datum_begin_geldigheid is niet gelijk aan een Versiedatum van een gerelateerd zaaktype.'))
-        #
-        # if self.datum_einde_geldigheid:
-        #     zaaktype_versiedatums = list(set(self.zaaktypes.values_list('versiedatum', flat=True)))
-        #
-        #     day_before_zaaktype_versie_datums = [parse_onvolledige_datum(_date) - timedelta(days=1) for _date in zaaktype_versiedatums]
-        #     if self.datum_begin_geldigheid not in day_before_zaaktype_versie_datums:
-        #         raise ValidationError(
-        #             _('Datum_einde_geldigheid is niet gelijk aan de dag voor een Versiedatum van een gerelateerd zaaktype.'))
+    # TODO: Validate that datum_begin_geldigheid is gelijk aan een Versiedatum van een gerelateerd zaaktype, and that
+    # datum_einde_geldigheid is gelijk aan de dag voor een Versiedatum van een gerelateerd zaaktype (see
+    # GeldigheidMixin.clean). The zaaktypes are a many to many relation, which can not be validated in model.clean, so
+    # this needs to be done in a form.
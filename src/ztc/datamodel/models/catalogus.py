@@ -1,6 +1,6 @@
 from django.core.validators import validate_integer
 from django.db import models
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
 from ..validators import validate_uppercase
 
@@ -46,6 +46,11 @@ class Catalogus(models.Model):
         verbose_name = _('Catalogus')
         verbose_name_plural = _('Catalogussen')
         ordering = unique_together
+        # The unique constraint already provides an index on (`domein`, `rsin`), which is used when filtering and
+        # ordering on both fields or on `domein` alone. Filtering and ordering on `rsin` alone needs its own index.
+        indexes = [
+            models.Index(fields=['rsin']),
+        ]
 
         filter_fields = (
             'domein',
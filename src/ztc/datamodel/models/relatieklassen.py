@@ -1,6 +1,6 @@
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
 from ztc.datamodel.choices import (
     AardRelatieChoices, ArchiefNominatieChoices, RichtingChoices
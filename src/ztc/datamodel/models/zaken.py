@@ -7,7 +7,7 @@ from django.core.validators import (
     MaxValueValidator, MinValueValidator, RegexValidator
 )
 from django.db import models
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
 
 
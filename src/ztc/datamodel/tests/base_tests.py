@@ -439,7 +439,7 @@ class HaaglandenMixin(object):
             besluittype_omschrijving_generiek='Ontvankelijkheidsbesluit',
             # besluitcategorie='',
             reactietermijn=42,  # 6 weken
-            publicatie_indicatie=JaNee.nee,  # required, but not in haaglanden
+            publicatie_indicatie=False,  # required, but not in haaglanden
             # publicatietekst='',
             # publicatietermijn=-99
             toelichting='Besluit over het niet ontvankelijk verklaren (bijvoorbeeld omdat de aanvrager niet'
@@ -453,7 +453,7 @@ class HaaglandenMixin(object):
             besluittype_omschrijving='Verlengingsbesluit',
             besluittype_omschrijving_generiek='Verlengingsbesluit',
             reactietermijn=42,  # 6 weken (of 15 weken)
-            publicatie_indicatie=JaNee.ja,
+            publicatie_indicatie=True,
             toelichting='De beslissing dat meer tijd genomen wordt voor de behandeling van de aanvraag.',
             maakt_deel_uit_van=self.catalogus,
             # Guess:
@@ -464,7 +464,7 @@ class HaaglandenMixin(object):
             besluittype_omschrijving='Besluit op aanvraag',
             besluittype_omschrijving_generiek='Vergunning',
             reactietermijn=42,  # 6 weken (+1 dag voor Raad van State)
-            publicatie_indicatie=JaNee.nee,  # required, but not in haaglanden
+            publicatie_indicatie=False,  # required, but not in haaglanden
             maakt_deel_uit_van=self.catalogus,
             # Guess:
             is_resultaat_van=[self.resultaattype_verleend, ],
@@ -474,7 +474,7 @@ class HaaglandenMixin(object):
             besluittype_omschrijving='Aanhoudingsbesluit',
             besluittype_omschrijving_generiek='',
             reactietermijn=42,  # 6 weken
-            publicatie_indicatie=JaNee.nee,
+            publicatie_indicatie=False,
             toelichting='',
             maakt_deel_uit_van=self.catalogus,
             # Guess:
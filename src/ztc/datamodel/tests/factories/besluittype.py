@@ -12,6 +12,7 @@ class BesluitTypeFactory(factory.django.DjangoModelFactory):
     besluittype_omschrijving = 'Besluittype'
     maakt_deel_uit_van = factory.SubFactory(CatalogusFactory)
     reactietermijn = 14
+    publicatie_indicatie = False
     datum_begin_geldigheid = date(2018, 1, 1)
 
     class Meta:
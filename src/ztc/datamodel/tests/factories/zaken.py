@@ -97,6 +97,9 @@ class ZaakTypeFactory(factory.django.DjangoModelFactory):
     @factory.post_generation
     def product_dienst(self, create, extracted, **kwargs):
         # required M2M
+        if not create:
+            return
+
         if not extracted:
             extracted = [ProductDienstFactory.create()]
 
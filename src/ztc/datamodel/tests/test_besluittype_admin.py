@@ -0,0 +1,49 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ...accounts.models import User
+from .factories import (
+    BesluitTypeFactory, CatalogusFactory, InformatieObjectTypeFactory
+)
+
+
+class BesluitTypeAdminTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        user = User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.force_login(user)
+
+        self.catalogus = CatalogusFactory.create()
+        self.besluittype = BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus,
+            wordt_vastgelegd_in=[InformatieObjectTypeFactory.create(maakt_deel_uit_van=self.catalogus)]
+        )
+        self.change_url = reverse('admin:datamodel_besluittype_change', args=[self.besluittype.pk])
+
+    def test_change_form_does_not_query_per_informatieobjecttype(self):
+        # Fill the caches (like the content types) that are used by the first request only.
+        self.client.get(self.change_url)
+
+        with CaptureQueriesContext(connection) as single_object_queries:
+            response = self.client.get(self.change_url)
+            self.assertEqual(response.status_code, 200)
+
+        self.besluittype.wordt_vastgelegd_in.add(
+            *InformatieObjectTypeFactory.create_batch(2, maakt_deel_uit_van=self.catalogus)
+        )
+        InformatieObjectTypeFactory.create_batch(2, maakt_deel_uit_van=CatalogusFactory.create())
+
+        with CaptureQueriesContext(connection) as multiple_objects_queries:
+            response = self.client.get(self.change_url)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(response.context['adminform'].form.initial['wordt_vastgelegd_in']), 3)
+        self.assertEqual(len(single_object_queries), len(multiple_objects_queries))
+
+    def test_delete_view(self):
+        response = self.client.get(reverse('admin:datamodel_besluittype_delete', args=[self.besluittype.pk]))
+
+        self.assertEqual(response.status_code, 200)
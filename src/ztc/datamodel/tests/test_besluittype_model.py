@@ -0,0 +1,67 @@
+from datetime import date
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from ..models import BesluitType
+from .factories import (
+    BesluitTypeFactory, CatalogusFactory, InformatieObjectTypeFactory
+)
+
+
+class BesluitTypeModelTests(TestCase):
+    def test_bulk_load_skips_existing_besluittypen(self):
+        catalogus = CatalogusFactory.create()
+        BesluitTypeFactory.create(maakt_deel_uit_van=catalogus, besluittype_omschrijving='Bestaand')
+
+        rows = [{
+            'maakt_deel_uit_van': catalogus,
+            'besluittype_omschrijving': besluittype_omschrijving,
+            'reactietermijn': 14,
+            'publicatie_indicatie': False,
+            'datum_begin_geldigheid': date(2018, 1, 1),
+        } for besluittype_omschrijving in ['Bestaand', 'Nieuw', 'Nieuw']]
+
+        created = BesluitType.objects.bulk_load(rows)
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(
+            list(BesluitType.objects.values_list('besluittype_omschrijving', flat=True)),
+            ['Bestaand', 'Nieuw']
+        )
+
+    def test_database_rejects_termijn_above_maximum(self):
+        besluittype = BesluitType(
+            maakt_deel_uit_van=CatalogusFactory.create(),
+            reactietermijn=1000,
+            publicatie_indicatie=False,
+            datum_begin_geldigheid=date(2018, 1, 1),
+        )
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            BesluitType.objects.bulk_create([besluittype])
+
+    def test_with_related_minimal_does_not_query_per_besluittype(self):
+        catalogus = CatalogusFactory.create()
+        for i in range(2):
+            BesluitTypeFactory.create(
+                maakt_deel_uit_van=catalogus,
+                besluittype_omschrijving='Besluittype {}'.format(i),
+                wordt_vastgelegd_in=InformatieObjectTypeFactory.create_batch(2, maakt_deel_uit_van=catalogus)
+            )
+
+        # One query for the BESLUITTYPEn with their CATALOGUS, and one for the INFORMATIEOBJECTTYPEn.
+        with self.assertNumQueries(2):
+            for besluittype in BesluitType.objects.with_related_minimal():
+                str(besluittype)
+                self.assertEqual(besluittype.maakt_deel_uit_van, catalogus)
+                for informatieobjecttype in besluittype.wordt_vastgelegd_in.all():
+                    self.assertTrue(informatieobjecttype.informatieobjecttype_omschrijving)
+
+    def test_str_follows_changed_catalogus(self):
+        besluittype = BesluitTypeFactory.create(besluittype_omschrijving='Besluittype')
+        str(besluittype)
+
+        besluittype.maakt_deel_uit_van.domein = 'FGHIJ'
+
+        self.assertEqual(str(besluittype), 'FGHIJ - {} - Besluittype'.format(besluittype.maakt_deel_uit_van.rsin))
@@ -0,0 +1,134 @@
+from unittest import mock
+
+from django.contrib.admin import site
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ...accounts.models import User
+from ..admin.eigenschap import EigenschapAdmin
+from ..models import Eigenschap
+from .factories import EigenschapFactory, ZaakTypeFactory
+
+
+class EigenschapAdminSearchTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.force_login(self.user)
+
+        self.zaaktype = ZaakTypeFactory.create()
+        self.eigenschap = EigenschapFactory.create(is_van=self.zaaktype, eigenschapnaam='Hoogte')
+        EigenschapFactory.create(is_van=self.zaaktype, eigenschapnaam='Breedte')
+
+        self.changelist_url = reverse('admin:datamodel_eigenschap_changelist')
+
+    def search(self, **params):
+        """
+        Return the search results on the changelist and whether the search fields were searched to find them.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.changelist_url, params)
+            self.assertEqual(response.status_code, 200)
+
+        searched = any('LIKE' in query['sql'] for query in queries)
+        return list(response.context['cl'].result_list), searched
+
+    def test_repeated_search_uses_cached_results(self):
+        results, searched = self.search(q='hoog')
+        self.assertEqual(results, [self.eigenschap])
+        self.assertTrue(searched)
+
+        results, searched = self.search(q='hoog')
+        self.assertEqual(results, [self.eigenschap])
+        self.assertFalse(searched)
+
+    def test_other_search_term_is_not_cached(self):
+        self.search(q='hoog')
+
+        results, searched = self.search(q='breed')
+        self.assertEqual([eigenschap.eigenschapnaam for eigenschap in results], ['Breedte'])
+        self.assertTrue(searched)
+
+    def test_other_filter_is_not_cached(self):
+        other_eigenschap = EigenschapFactory.create(eigenschapnaam='Hoogte')
+        self.search(q='hoog', is_van__id__exact=self.zaaktype.pk)
+
+        results, searched = self.search(q='hoog', is_van__id__exact=other_eigenschap.is_van.pk)
+        self.assertEqual(results, [other_eigenschap])
+        self.assertTrue(searched)
+
+    def test_results_over_the_limit_are_not_cached(self):
+        with mock.patch.object(EigenschapAdmin, 'search_results_cache_limit', 1):
+            self.search(q='te')
+
+            results, searched = self.search(q='te')
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(searched)
+
+    def test_search_without_results_is_cached(self):
+        self.search(q='diepte')
+
+        results, searched = self.search(q='diepte')
+        self.assertEqual(results, [])
+        self.assertFalse(searched)
+
+    def test_empty_queryset_is_not_cached(self):
+        model_admin = site._registry[Eigenschap]
+        request = RequestFactory().get(self.changelist_url)
+        request.user = self.user
+
+        with mock.patch('ztc.datamodel.admin.mixins.cache') as mock_cache:
+            results, use_distinct = model_admin.get_search_results(request, Eigenschap.objects.none(), 'hoog')
+
+        self.assertEqual(list(results), [])
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+
+class EigenschapAdminTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        user = User.objects.create_superuser('admin', 'admin@example.com', 'secret')
+        self.client.force_login(user)
+
+        self.zaaktype = ZaakTypeFactory.create()
+        self.eigenschap = EigenschapFactory.create(is_van=self.zaaktype)
+
+    def assertNumQueriesDoesNotGrow(self, url, add_objects):
+        # Fill the caches (like the content types) that are used by the first request only.
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as single_object_queries:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+        add_objects()
+
+        with CaptureQueriesContext(connection) as multiple_objects_queries:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(single_object_queries), len(multiple_objects_queries))
+        return response
+
+    def test_changelist_does_not_query_per_eigenschap(self):
+        # The filter on `is_van` lists all ZAAKTYPEn, so the EIGENSCHAPpen are added to the same ZAAKTYPE.
+        response = self.assertNumQueriesDoesNotGrow(
+            reverse('admin:datamodel_eigenschap_changelist'),
+            lambda: EigenschapFactory.create_batch(2, is_van=self.zaaktype)
+        )
+
+        self.assertEqual(len(response.context['cl'].result_list), 3)
+
+    def test_change_form_does_not_query_per_zaaktype(self):
+        self.assertNumQueriesDoesNotGrow(
+            reverse('admin:datamodel_eigenschap_change', args=[self.eigenschap.pk]),
+            lambda: ZaakTypeFactory.create_batch(2)
+        )
@@ -0,0 +1,62 @@
+from datetime import date
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class MigrationTestCase(TransactionTestCase):
+    """
+    Migrate to `migrate_from`, let `setUpBeforeMigration` create the data with the models of that state, and migrate
+    to `migrate_to`. The database is migrated to the latest state again afterwards.
+    """
+    migrate_from = None
+    migrate_to = None
+
+    def setUp(self):
+        super().setUp()
+
+        executor = MigrationExecutor(connection)
+        executor.migrate([self.migrate_from])
+        self.setUpBeforeMigration(executor.loader.project_state([self.migrate_from]).apps)
+
+        # The migration graph has to be reloaded after migrating.
+        executor = MigrationExecutor(connection)
+        executor.migrate([self.migrate_to])
+        self.apps = executor.loader.project_state([self.migrate_to]).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+        super().tearDown()
+
+    def setUpBeforeMigration(self, apps):
+        pass
+
+
+class BesluitTypeTextFieldsMigrationTests(MigrationTestCase):
+    migrate_from = ('datamodel', '0012_besluittype_indexes')
+    migrate_to = ('datamodel', '0013_besluittype_text_fields')
+
+    def setUpBeforeMigration(self, apps):
+        Catalogus = apps.get_model('datamodel', 'Catalogus')
+        BesluitType = apps.get_model('datamodel', 'BesluitType')
+
+        catalogus = Catalogus.objects.create(domein='ABCDE', rsin='000000001', contactpersoon_beheer_naam='John Doe')
+        self.besluittype_id = BesluitType.objects.create(
+            maakt_deel_uit_van=catalogus,
+            besluittype_omschrijving='Besluittype',
+            reactietermijn=14,
+            publicatie_indicatie='N',
+            publicatietekst=None,
+            toelichting=None,
+            datum_begin_geldigheid=date(2018, 1, 1),
+        ).pk
+
+    def test_null_values_become_empty(self):
+        BesluitType = self.apps.get_model('datamodel', 'BesluitType')
+
+        besluittype = BesluitType.objects.get(pk=self.besluittype_id)
+        self.assertEqual(besluittype.publicatietekst, '')
+        self.assertEqual(besluittype.toelichting, '')
@@ -1,7 +1,7 @@
 from urllib.parse import urlencode
 
 from django.urls import reverse
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import gettext_lazy as _
 
 
 class ObjectActionsAdminMixin(object):